@@ -12,6 +12,11 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from abductio_core.application.dto import EvidenceItem
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 
 def _first_text(response: Any) -> str:
     if hasattr(response, "output_text") and response.output_text:
@@ -41,13 +46,22 @@ def _hash_text(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
+def _json_loads(text: str) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
 def _extract_json_object(text: str) -> Dict[str, Any]:
     candidate = str(text or "").strip()
     if not candidate:
         raise json.JSONDecodeError("empty response", candidate, 0)
 
     try:
-        payload = json.loads(candidate)
+        payload = _json_loads(candidate)
         if isinstance(payload, dict):
             return payload
     except json.JSONDecodeError:
@@ -58,7 +72,7 @@ def _extract_json_object(text: str) -> Dict[str, Any]:
         fenced = re.sub(r"^```(?:json)?\s*", "", fenced, flags=re.IGNORECASE)
         fenced = re.sub(r"\s*```$", "", fenced)
         try:
-            payload = json.loads(fenced)
+            payload = _json_loads(fenced)
             if isinstance(payload, dict):
                 return payload
         except json.JSONDecodeError:
@@ -68,11 +82,11 @@ def _extract_json_object(text: str) -> Dict[str, Any]:
     end = candidate.rfind("}")
     if start >= 0 and end > start:
         snippet = candidate[start : end + 1]
-        payload = json.loads(snippet)
+        payload = _json_loads(snippet)
         if isinstance(payload, dict):
             return payload
 
-    payload = json.loads(candidate)
+    payload = _json_loads(candidate)
     if isinstance(payload, dict):
         return payload
     raise json.JSONDecodeError("response JSON is not an object", candidate, 0)
@@ -123,6 +137,7 @@ class OpenAIJsonClient:
     retry_jitter_s: float = 0.25
     fallback_models: Tuple[str, ...] = ()
     base_url: Optional[str] = None
+    http_client: Optional[Any] = None
 
     def __post_init__(self) -> None:
         key = self.api_key or os.getenv("OPENAI_API_KEY")
@@ -139,8 +154,15 @@ class OpenAIJsonClient:
         kwargs: Dict[str, Any] = {"api_key": key, "timeout": self.timeout_s}
         if base_url:
             kwargs["base_url"] = base_url
+        if self.http_client is not None:
+            kwargs["http_client"] = self.http_client
         self._client = openai_cls(**kwargs)
 
+    def close(self) -> None:
+        close = getattr(self._client, "close", None)
+        if callable(close):
+            close()
+
     def _sleep_for_retry(self, attempt: int) -> None:
         delay = float(self.retry_backoff_s) * (2**attempt)
         if self.retry_backoff_max_s > 0:
@@ -243,28 +265,32 @@ class OpenAIJsonClient:
         ) from last_exc
 
 
+_EVALUATION_REQUIRED_KEYS = (
+    "p",
+    "A",
+    "B",
+    "C",
+    "D",
+    "evidence_ids",
+    "discriminator_ids",
+    "discriminator_payloads",
+    "entailment",
+    "reasoning_summary",
+    "defeaters",
+    "uncertainty_source",
+    "evidence_quality",
+    "assumptions",
+)
+_EVALUATION_REQUIRED_KEY_SET = frozenset(_EVALUATION_REQUIRED_KEYS)
+_ENTAILMENTS = frozenset({"SUPPORTS", "CONTRADICTS", "NEUTRAL", "UNKNOWN"})
+_EVIDENCE_QUALITIES = frozenset({"direct", "indirect", "weak", "none"})
+_AND_COUPLINGS = frozenset({0.20, 0.50, 0.80, 0.95})
+_CHILD_ROLES = frozenset({"NEC", "EVID"})
+
+
 def _validate_evaluation(outcome: Dict[str, Any]) -> None:
-    missing = [
-        key
-        for key in (
-            "p",
-            "A",
-            "B",
-            "C",
-            "D",
-            "evidence_ids",
-            "discriminator_ids",
-            "discriminator_payloads",
-            "entailment",
-            "reasoning_summary",
-            "defeaters",
-            "uncertainty_source",
-            "evidence_quality",
-            "assumptions",
-        )
-        if key not in outcome
-    ]
-    if missing:
+    if not _EVALUATION_REQUIRED_KEY_SET.issubset(outcome):
+        missing = [key for key in _EVALUATION_REQUIRED_KEYS if key not in outcome]
         raise RuntimeError(f"LLM evaluation missing keys: {missing}")
     try:
         p_value = float(outcome["p"])
@@ -313,10 +339,10 @@ def _validate_evaluation(outcome: Dict[str, Any]) -> None:
         if discriminator_id not in discriminator_ids:
             raise RuntimeError("LLM evaluation discriminator_payload.id must appear in discriminator_ids")
     entailment = str(outcome.get("entailment", "")).strip().upper()
-    if entailment not in {"SUPPORTS", "CONTRADICTS", "NEUTRAL", "UNKNOWN"}:
+    if entailment not in _ENTAILMENTS:
         raise RuntimeError("LLM evaluation entailment must be one of {SUPPORTS,CONTRADICTS,NEUTRAL,UNKNOWN}")
     evidence_quality = outcome.get("evidence_quality")
-    if evidence_quality not in {"direct", "indirect", "weak", "none"}:
+    if evidence_quality not in _EVIDENCE_QUALITIES:
         raise RuntimeError("LLM evaluation evidence_quality must be one of {direct,indirect,weak,none}")
     if not isinstance(outcome.get("reasoning_summary"), str) or not outcome["reasoning_summary"].strip():
         raise RuntimeError("LLM evaluation reasoning_summary must be a non-empty string")
@@ -355,7 +381,7 @@ def _validate_slot_decomposition(out: Dict[str, Any]) -> None:
             cf = float(c)
         except Exception as exc:
             raise RuntimeError("LLM slot decomposition coupling must be float") from exc
-        if cf not in {0.20, 0.50, 0.80, 0.95}:
+        if cf not in _AND_COUPLINGS:
             raise RuntimeError("LLM slot decomposition coupling must be one of {0.20,0.50,0.80,0.95}")
     for child in children:
         if not isinstance(child, dict):
@@ -372,7 +398,7 @@ def _validate_slot_decomposition(out: Dict[str, Any]) -> None:
         if overlap is None or not isinstance(overlap, list):
             raise RuntimeError("LLM slot decomposition child missing overlap_with_siblings list")
         role = child.get("role", "NEC")
-        if role not in {"NEC", "EVID"}:
+        if role not in _CHILD_ROLES:
             raise RuntimeError("LLM slot decomposition child role must be NEC or EVID")
 
 
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import math
 import os
 import re
+import sys
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional
 
 from behave import given, then, when
@@ -15,6 +18,27 @@ from tests.bdd.steps.support.step_world import StepWorld
 
 RESIDUAL_IDS = {"H_NOA", "H_UND"}
 SEARCH_EVENT_MARKERS = ("SEARCH",)
+_POLICY_HASH_CACHE: Dict[tuple, str] = {}
+_ABLATION_METRIC_NAMES = (
+    "top1_selection_accuracy",
+    "top1_certification_accuracy",
+    "brier_mean",
+    "calibration_ece",
+    "abstention_honesty_rate",
+    "credits_exhausted_rate",
+    "resolved_pair_coverage_mean",
+)
+_ABLATION_METRIC_SET = frozenset(_ABLATION_METRIC_NAMES)
+_FROZEN_BASELINE_TEMPLATE = MappingProxyType(
+    {
+        "model_id": None,
+        "policy_file": None,
+        "packet_case_ids": (),
+        "seed_values": (),
+        "manifest": None,
+        "forced_drift_field": None,
+    }
+)
 
 
 def get_world(context) -> StepWorld:
@@ -105,8 +129,10 @@ def _parse_ln_ratio(expr: str) -> float:
 def _latest_event(world: StepWorld, event_type: str) -> Dict[str, Any] | None:
     if not world.result:
         return None
-    events = [e for e in world.result.get("audit", []) if e.get("event_type") == event_type]
-    return events[-1] if events else None
+    for event in reversed(world.result.get("audit", [])):
+        if event.get("event_type") == event_type:
+            return event
+    return None
 
 
 def _events(world: StepWorld, event_type: str) -> List[Dict[str, Any]]:
@@ -200,23 +226,34 @@ def _ensure_result_shell(world: StepWorld) -> Dict[str, Any]:
 
 
 def _append_audit_event(world: StepWorld, event_type: str, payload: Optional[Dict[str, Any]] = None) -> None:
-    result = _ensure_result_shell(world)
-    audit = result.setdefault("audit", [])
-    assert isinstance(audit, list)
-    audit.append({"event_type": str(event_type), "payload": dict(payload or {})})
+    audit = world.result.get("audit") if isinstance(world.result, dict) else None
+    if not isinstance(audit, list):
+        audit = _ensure_result_shell(world).setdefault("audit", [])
+        assert isinstance(audit, list)
+    audit.append({"event_type": sys.intern(str(event_type)), "payload": dict(payload or {})})
+
+
+def _canonical_json(value: Any) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=True).encode("utf-8")
 
 
 def _sha256_json(value: Any) -> str:
-    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=True).encode("utf-8")
-    return hashlib.sha256(encoded).hexdigest()
+    return hashlib.sha256(_canonical_json(value)).hexdigest()
 
 
 def _sha256_file(path: str) -> str:
-    hasher = hashlib.sha256()
     with open(path, "rb") as handle:
-        for chunk in iter(lambda: handle.read(8192), b""):
-            hasher.update(chunk)
-    return hasher.hexdigest()
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+def _sha256_file_cached(path: str) -> str:
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    digest = _POLICY_HASH_CACHE.get(key)
+    if digest is None:
+        digest = _sha256_file(path)
+        _POLICY_HASH_CACHE[key] = digest
+    return digest
 
 
 def _metadata_has_field(metadata: Dict[str, Any], field: str) -> bool:
@@ -251,18 +288,21 @@ def _next_steps(world: StepWorld) -> List[Dict[str, Any]]:
     return [row for row in event_next_steps if isinstance(row, dict)]
 
 
+_LOWER_IS_BETTER_MARKERS = (
+    "brier",
+    "ece",
+    "variance",
+    "error",
+    "loss",
+    "mae",
+    "rmse",
+)
+
+
+@functools.lru_cache(maxsize=256)
 def _release_metric_lower_is_better(metric: str) -> bool:
     token = str(metric).strip().lower()
-    lower_markers = (
-        "brier",
-        "ece",
-        "variance",
-        "error",
-        "loss",
-        "mae",
-        "rmse",
-    )
-    return any(marker in token for marker in lower_markers)
+    return any(marker in token for marker in _LOWER_IS_BETTER_MARKERS)
 
 
 def _payload_code(payload: Dict[str, Any]) -> Optional[str]:
@@ -630,8 +670,9 @@ def given_frame_inadequacy_reserve_mass(context, mass: float, root_id: str) -> N
 @given('calibration profile "{profile}" reports calibrated confidence {confidence:f} for this claim class')
 def given_calibration_profile_confidence(context, profile: str, confidence: float) -> None:
     world = get_world(context)
-    _policy(world)["calibration_profile"] = str(profile)
-    _policy(world)["calibrated_confidence"] = float(confidence)
+    policy = _policy(world)
+    policy["calibration_profile"] = str(profile)
+    policy["calibrated_confidence"] = float(confidence)
 
 
 @given('reasoning profile is "{profile}"')
@@ -1075,10 +1116,11 @@ def given_dependency_penalty_confidence_cap(context, cap: float) -> None:
 @given('all supporting evidence for root "{root_id}" originates from source "{source_id}"')
 def given_root_supporting_evidence_single_source(context, root_id: str, source_id: str) -> None:
     world = get_world(context)
-    source_map = _policy(world).setdefault("root_support_sources", {})
+    policy = _policy(world)
+    source_map = policy.setdefault("root_support_sources", {})
     if not isinstance(source_map, dict):
         source_map = {}
-        _policy(world)["root_support_sources"] = source_map
+        policy["root_support_sources"] = source_map
     source_map[str(root_id)] = str(source_id)
 
 
@@ -1093,10 +1135,11 @@ def given_slot_assumptions_for_root(context, root_id: str) -> None:
     world = get_world(context)
     assumptions = [row.get("assumption_id", "").strip() for row in table_rows(context.table)]
     assumptions = [item for item in assumptions if item]
-    by_root = _policy(world).setdefault("slot_assumptions_by_root", {})
+    policy = _policy(world)
+    by_root = policy.setdefault("slot_assumptions_by_root", {})
     if not isinstance(by_root, dict):
         by_root = {}
-        _policy(world)["slot_assumptions_by_root"] = by_root
+        policy["slot_assumptions_by_root"] = by_root
     by_root[str(root_id)] = assumptions
 
 
@@ -2548,7 +2591,7 @@ def then_release_gate_report_includes_failing_metrics(context) -> None:
     world = get_world(context)
     report = world.release_gate_report
     assert isinstance(report, dict) and report, "release gate report not available"
-    failing = {str(item).strip() for item in report.get("failing_metrics", []) if str(item).strip()}
+    failing = {text for item in report.get("failing_metrics", []) if (text := str(item).strip())}
     missing: List[str] = []
     for row in table_rows(context.table):
         metric = str(row.get("metric", "")).strip()
@@ -3023,7 +3066,7 @@ def then_audit_events_payload_field_include_values(context, event_type: str, fie
         world.mark_pending("Session result not available")
     events = [event for event in world.result.get("audit", []) if event.get("event_type") == event_type]
     assert events, f"missing audit events {event_type}"
-    actual_values = []
+    actual_values: set[str] = set()
     for event in events:
         payload = event.get("payload", {})
         if not isinstance(payload, dict):
@@ -3032,15 +3075,15 @@ def then_audit_events_payload_field_include_values(context, event_type: str, fie
             continue
         value = payload.get(field)
         if isinstance(value, (list, tuple, set)):
-            actual_values.extend(str(item) for item in value)
+            actual_values.update(str(item) for item in value)
         else:
-            actual_values.append(str(value))
+            actual_values.add(str(value))
     expected_values = [str(row.get("value", "")).strip() for row in table_rows(context.table)]
     expected_values = [item for item in expected_values if item]
     missing = [value for value in expected_values if value not in actual_values]
     assert not missing, (
         f'{event_type} payload field {field!r} missing expected values {missing}; '
-        f"actual_values={actual_values}"
+        f"actual_values={sorted(actual_values)}"
     )
 
 
@@ -3081,7 +3124,7 @@ def then_audit_event_payload_field_at_most(context, event_type: str, field: str,
 
 
 def _baseline_state(world: StepWorld) -> Dict[str, Any]:
-    state = getattr(world, "frozen_baseline_state", None)
+    state = world.frozen_baseline_state
     assert isinstance(state, dict), "Frozen baseline is not initialized"
     return state
 
@@ -3121,14 +3164,14 @@ def _materialize_baseline_manifest(state: Dict[str, Any], world: StepWorld, *, s
             seed_values = [0]
             state["seed_values"] = seed_values
 
-    policy_hash = _sha256_file(policy_file) if os.path.exists(policy_file) else _sha256_json({"policy_file": policy_file})
+    policy_hash = _sha256_file_cached(policy_file) if os.path.exists(policy_file) else _sha256_json({"policy_file": policy_file})
     packet_hash = _sha256_json(sorted(packet_case_ids))
     seed_set_hash = _sha256_json(sorted(int(seed) for seed in seed_values))
     prompt_bundle_hash = _sha256_json(
         {
             "model_id": model_id,
             "required_slots": list(world.required_slots),
-            "policy_overrides": dict(_policy(world)),
+            "policy_overrides": _policy(world),
         }
     )
     manifest = {
@@ -3149,18 +3192,16 @@ def _materialize_baseline_manifest(state: Dict[str, Any], world: StepWorld, *, s
 @given('a frozen benchmark baseline named "{baseline_id}"')
 def given_frozen_benchmark_baseline_named(context, baseline_id: str) -> None:
     world = get_world(context)
-    world.frozen_baseline_state = {
-        "baseline_id": str(baseline_id).strip(),
-        "model_id": None,
-        "policy_file": None,
-        "packet_case_ids": [],
-        "seed_values": [],
-        "manifest": {},
-        "forced_drift_field": None,
-    }
-    world.ablation_run_result = {}
-    world.completed_runs = {}
-    world.replayed_run = {}
+    state = world.frozen_baseline_state
+    if state is None:
+        state = world.frozen_baseline_state = {}
+    else:
+        state.clear()
+    state.update(_FROZEN_BASELINE_TEMPLATE)
+    state["baseline_id"] = str(baseline_id).strip()
+    world.ablation_run_result.clear()
+    world.completed_runs.clear()
+    world.replayed_run.clear()
     _ensure_result_shell(world)
 
 
@@ -3292,7 +3333,7 @@ def when_start_comparative_ablation_run(context) -> None:
 @then('the run is rejected with reason "{reason}"')
 def then_run_is_rejected_with_reason(context, reason: str) -> None:
     world = get_world(context)
-    result = getattr(world, "ablation_run_result", {})
+    result = world.ablation_run_result
     assert isinstance(result, dict) and result, "comparative ablation run result not available"
     status = str(result.get("status", "")).strip().upper()
     actual_reason = str(result.get("reason", "")).strip()
@@ -3307,20 +3348,17 @@ def given_completed_run_tied_to_baseline(context, run_id: str) -> None:
     manifest = _materialize_baseline_manifest(state, world, strict=False)
     run_id_clean = str(run_id).strip()
     assert run_id_clean, "run_id must be non-empty"
-    signature = _sha256_json(
-        {
-            "baseline_id": manifest.get("baseline_id"),
-            "run_id": run_id_clean,
-            "seed_set_hash": manifest.get("seed_set_hash"),
-            "packet_hash": manifest.get("packet_hash"),
-        }
-    )
+    prefix_key = (manifest.get("baseline_id"), manifest.get("seed_set_hash"), manifest.get("packet_hash"))
+    cached_prefix = state.get("_run_sig_prefix")
+    if not cached_prefix or cached_prefix[0] != prefix_key:
+        cached_prefix = (prefix_key, _sha256_json(list(prefix_key)).encode("utf-8"))
+        state["_run_sig_prefix"] = cached_prefix
+    signature = hashlib.sha256(cached_prefix[1] + b"|" + run_id_clean.encode("utf-8")).hexdigest()
     distribution = {
         "H1": 0.52,
         "H2": 0.31,
         "H_UND": 0.17,
     }
-    world.completed_runs = getattr(world, "completed_runs", {})
     world.completed_runs[run_id_clean] = {
         "run_signature": signature,
         "top_root_distribution": distribution,
@@ -3332,7 +3370,7 @@ def given_completed_run_tied_to_baseline(context, run_id: str) -> None:
 def when_replay_run_from_frozen_manifest(context, run_id: str) -> None:
     world = get_world(context)
     run_id_clean = str(run_id).strip()
-    completed_runs = getattr(world, "completed_runs", {})
+    completed_runs = world.completed_runs
     assert isinstance(completed_runs, dict) and run_id_clean in completed_runs, (
         f"completed run {run_id_clean!r} not found"
     )
@@ -3355,10 +3393,10 @@ def when_replay_run_from_frozen_manifest(context, run_id: str) -> None:
 @then("replay output run signature equals original run signature")
 def then_replay_signature_equals_original(context) -> None:
     world = get_world(context)
-    replayed = getattr(world, "replayed_run", {})
+    replayed = world.replayed_run
     run_id = str(replayed.get("run_id", "")).strip()
     assert run_id, "replayed run is not available"
-    original = getattr(world, "completed_runs", {}).get(run_id, {})
+    original = world.completed_runs.get(run_id, {})
     assert replayed.get("run_signature") == original.get("run_signature"), (
         f"replay run_signature mismatch: replay={replayed.get('run_signature')}, "
         f"original={original.get('run_signature')}"
@@ -3368,10 +3406,10 @@ def then_replay_signature_equals_original(context) -> None:
 @then("replay output top root distribution equals original top root distribution")
 def then_replay_distribution_equals_original(context) -> None:
     world = get_world(context)
-    replayed = getattr(world, "replayed_run", {})
+    replayed = world.replayed_run
     run_id = str(replayed.get("run_id", "")).strip()
     assert run_id, "replayed run is not available"
-    original = getattr(world, "completed_runs", {}).get(run_id, {})
+    original = world.completed_runs.get(run_id, {})
     replay_dist = replayed.get("top_root_distribution")
     orig_dist = original.get("top_root_distribution")
     assert isinstance(replay_dist, dict) and isinstance(orig_dist, dict), "run distributions must be dict values"
@@ -3536,10 +3574,11 @@ def given_compositional_complexity_penalty_lambda(context, value: float) -> None
 @given('joint-support evidence for story "{story_id}" is {score:f}')
 def given_joint_support_evidence_for_story(context, story_id: str, score: float) -> None:
     world = get_world(context)
-    by_story = _policy(world).setdefault("joint_support_evidence_by_story", {})
+    policy = _policy(world)
+    by_story = policy.setdefault("joint_support_evidence_by_story", {})
     if not isinstance(by_story, dict):
         by_story = {}
-        _policy(world)["joint_support_evidence_by_story"] = by_story
+        policy["joint_support_evidence_by_story"] = by_story
     by_story[str(story_id).strip()] = float(score)
 
 
@@ -3647,26 +3686,28 @@ def when_execute_ablation_matrix(context) -> None:
     world = get_world(context)
     state = _baseline_state(world)
     manifest = _materialize_baseline_manifest(state, world, strict=False)
-    variants = list(getattr(world, "ablation_variants", []))
+    variants = world.ablation_variants
     assert variants, "ablation variants are required before executing ablation matrix"
-    rows: List[Dict[str, Any]] = []
-    for idx, variant_id in enumerate(variants):
-        rows.append(
-            {
-                "variant_id": variant_id,
-                "baseline_id": manifest.get("baseline_id"),
-                "packet_hash": manifest.get("packet_hash"),
-                "seed_set_hash": manifest.get("seed_set_hash"),
-                "model_id": manifest.get("model_id"),
-                "top1_selection_accuracy": max(0.0, 0.45 + 0.03 * idx),
-                "top1_certification_accuracy": max(0.0, 0.30 + 0.02 * idx),
-                "brier_mean": max(0.0, 0.35 - 0.02 * idx),
-                "calibration_ece": max(0.0, 0.15 - 0.01 * idx),
-                "abstention_honesty_rate": min(1.0, 0.55 + 0.03 * idx),
-                "credits_exhausted_rate": max(0.0, 0.60 - 0.04 * idx),
-                "resolved_pair_coverage_mean": min(1.0, 0.35 + 0.05 * idx),
-            }
-        )
+    invariants = {
+        "baseline_id": manifest.get("baseline_id"),
+        "packet_hash": manifest.get("packet_hash"),
+        "seed_set_hash": manifest.get("seed_set_hash"),
+        "model_id": manifest.get("model_id"),
+    }
+    rows: List[Dict[str, Any]] = [
+        {
+            "variant_id": variant_id,
+            **invariants,
+            "top1_selection_accuracy": max(0.0, 0.45 + 0.03 * idx),
+            "top1_certification_accuracy": max(0.0, 0.30 + 0.02 * idx),
+            "brier_mean": max(0.0, 0.35 - 0.02 * idx),
+            "calibration_ece": max(0.0, 0.15 - 0.01 * idx),
+            "abstention_honesty_rate": min(1.0, 0.55 + 0.03 * idx),
+            "credits_exhausted_rate": max(0.0, 0.60 - 0.04 * idx),
+            "resolved_pair_coverage_mean": min(1.0, 0.35 + 0.05 * idx),
+        }
+        for idx, variant_id in enumerate(variants)
+    ]
     world.ablation_report = {"rows": rows}
     _append_audit_event(
         world,
@@ -3678,34 +3719,35 @@ def when_execute_ablation_matrix(context) -> None:
 @then("the ablation report includes one row per variant")
 def then_ablation_report_includes_one_row_per_variant(context) -> None:
     world = get_world(context)
-    report = getattr(world, "ablation_report", {})
+    report = world.ablation_report
     assert isinstance(report, dict), "ablation report not available"
     rows = report.get("rows")
     assert isinstance(rows, list), "ablation report rows are missing"
-    variants = list(getattr(world, "ablation_variants", []))
-    assert len(rows) == len(variants), f"expected {len(variants)} ablation rows, got {len(rows)}"
+    expected_rows = len(world.ablation_variants)
+    assert len(rows) == expected_rows, f"expected {expected_rows} ablation rows, got {len(rows)}"
 
 
 @then("the ablation report records invariant fields")
 @then("the ablation report records invariant fields:")
 def then_ablation_report_records_invariant_fields(context) -> None:
     world = get_world(context)
-    report = getattr(world, "ablation_report", {})
+    report = world.ablation_report
     rows = report.get("rows") if isinstance(report, dict) else None
     assert isinstance(rows, list) and rows, "ablation report rows are missing"
     required_fields = [str(row.get("field", "")).strip() for row in table_rows(context.table)]
     required_fields = [field for field in required_fields if field]
     assert required_fields, "at least one invariant field must be provided"
+    required = frozenset(required_fields)
     for row in rows:
         assert isinstance(row, dict), f"ablation report row must be dict, got {type(row).__name__}"
-        missing = [field for field in required_fields if field not in row]
-        assert not missing, f"ablation row missing invariant fields {missing}: row={row}"
+        missing = required.difference(row)
+        assert not missing, f"ablation row missing invariant fields {sorted(missing)}: row={row}"
 
 
 @given("a completed ablation matrix result")
 def given_completed_ablation_matrix_result(context) -> None:
     world = get_world(context)
-    report = getattr(world, "ablation_report", None)
+    report = world.ablation_report
     if isinstance(report, dict) and isinstance(report.get("rows"), list) and report["rows"]:
         return
     world.ablation_report = {
@@ -3727,22 +3769,14 @@ def given_completed_ablation_matrix_result(context) -> None:
 @when("I build the ablation summary")
 def when_build_ablation_summary(context) -> None:
     world = get_world(context)
-    report = getattr(world, "ablation_report", {})
+    report = world.ablation_report
     rows = report.get("rows") if isinstance(report, dict) else None
     assert isinstance(rows, list) and rows, "ablation report rows are required to build summary"
     summary_rows: List[Dict[str, Any]] = []
-    metric_names = [
-        "top1_selection_accuracy",
-        "top1_certification_accuracy",
-        "brier_mean",
-        "calibration_ece",
-        "abstention_honesty_rate",
-        "credits_exhausted_rate",
-        "resolved_pair_coverage_mean",
-    ]
     for row in rows:
         assert isinstance(row, dict), f"ablation report row must be dict, got {type(row).__name__}"
-        metric_payload = {metric: row.get(metric) for metric in metric_names}
+        metric_payload = dict.fromkeys(_ABLATION_METRIC_NAMES)
+        metric_payload.update({metric: row[metric] for metric in _ABLATION_METRIC_SET.intersection(row)})
         summary_rows.append({"variant_id": row.get("variant_id"), "metrics": metric_payload})
     world.ablation_summary = {"rows": summary_rows}
 
@@ -3751,17 +3785,18 @@ def when_build_ablation_summary(context) -> None:
 @then("each variant row includes metrics:")
 def then_each_variant_row_includes_metrics(context) -> None:
     world = get_world(context)
-    summary = getattr(world, "ablation_summary", {})
+    summary = world.ablation_summary
     rows = summary.get("rows") if isinstance(summary, dict) else None
     assert isinstance(rows, list) and rows, "ablation summary rows are missing"
     expected_metrics = [str(row.get("metric_name", "")).strip() for row in table_rows(context.table)]
     expected_metrics = [metric for metric in expected_metrics if metric]
     assert expected_metrics, "at least one metric_name must be provided"
+    required = frozenset(expected_metrics)
     for row in rows:
         metrics = row.get("metrics")
         assert isinstance(metrics, dict), f"ablation summary row metrics must be dict, got {type(metrics).__name__}"
-        missing = [metric for metric in expected_metrics if metric not in metrics]
-        assert not missing, f"ablation summary row missing metrics {missing}: row={row}"
+        missing = required.difference(metrics)
+        assert not missing, f"ablation summary row missing metrics {sorted(missing)}: row={row}"
 
 
 @given("held-out domain metric deltas versus baseline")
@@ -3769,15 +3804,17 @@ def then_each_variant_row_includes_metrics(context) -> None:
 def given_held_out_domain_metric_deltas_vs_baseline(context) -> None:
     world = get_world(context)
     deltas: List[Dict[str, Any]] = []
-    for row in table_rows(context.table):
-        domain_id = str(row.get("domain_id", "")).strip()
+    headings = [str(heading).strip() for heading in context.table.headings]
+    domain_col = headings.index("domain_id") if "domain_id" in headings else None
+    metric_cols = [(idx, key) for idx, key in enumerate(headings) if idx != domain_col]
+    for raw in context.table.rows:
+        cells = raw.cells
+        domain_id = cells[domain_col].strip() if domain_col is not None else ""
         if not domain_id:
             continue
         cleaned: Dict[str, Any] = {"domain_id": domain_id}
-        for key, value in row.items():
-            if key == "domain_id":
-                continue
-            text = str(value).strip()
+        for idx, key in metric_cols:
+            text = cells[idx].strip()
             if not text:
                 continue
             try:
@@ -3794,9 +3831,13 @@ def given_held_out_domain_metric_deltas_vs_baseline(context) -> None:
 def given_non_regression_tolerances(context) -> None:
     world = get_world(context)
     tolerances: Dict[str, float] = {}
-    for row in table_rows(context.table):
-        metric_name = str(row.get("metric_name", "")).strip()
-        raw_floor = str(row.get("floor", "")).strip()
+    headings = [str(heading).strip() for heading in context.table.headings]
+    metric_col = headings.index("metric_name") if "metric_name" in headings else None
+    floor_col = headings.index("floor") if "floor" in headings else None
+    for raw in context.table.rows:
+        cells = raw.cells
+        metric_name = cells[metric_col].strip() if metric_col is not None else ""
+        raw_floor = cells[floor_col].strip() if floor_col is not None else ""
         if not metric_name:
             continue
         try:
@@ -3810,14 +3851,18 @@ def given_non_regression_tolerances(context) -> None:
 @when("I evaluate the non-regression release gate")
 def when_evaluate_non_regression_release_gate(context) -> None:
     world = get_world(context)
-    domain_deltas = getattr(world, "nonregression_domain_deltas", [])
-    tolerances = getattr(world, "nonregression_tolerances", {})
+    domain_deltas = world.nonregression_domain_deltas
+    tolerances = world.nonregression_tolerances
     assert isinstance(domain_deltas, list) and domain_deltas, "held-out domain deltas are required before evaluation"
     assert isinstance(tolerances, dict) and tolerances, "non-regression tolerances are required before evaluation"
 
-    failing_domains: List[str] = []
+    failing_domains: set[str] = set()
     domain_results: List[Dict[str, Any]] = []
     failing_metrics_union: set[str] = set()
+    metric_specs = [
+        (metric_name, float(threshold), _release_metric_lower_is_better(metric_name))
+        for metric_name, threshold in tolerances.items()
+    ]
 
     for row in domain_deltas:
         domain_id = str(row.get("domain_id", "")).strip()
@@ -3825,7 +3870,7 @@ def when_evaluate_non_regression_release_gate(context) -> None:
             continue
         metric_results: List[Dict[str, Any]] = []
         domain_failed = False
-        for metric_name, threshold in tolerances.items():
+        for metric_name, threshold, lower_is_better in metric_specs:
             if metric_name not in row:
                 domain_failed = True
                 failing_metrics_union.add(metric_name)
@@ -3833,18 +3878,17 @@ def when_evaluate_non_regression_release_gate(context) -> None:
                     {
                         "metric": metric_name,
                         "status": "MISSING",
-                        "threshold": float(threshold),
+                        "threshold": threshold,
                     }
                 )
                 continue
             value = float(row[metric_name])
-            lower_is_better = _release_metric_lower_is_better(metric_name)
-            passed = value <= float(threshold) if lower_is_better else value >= float(threshold)
+            passed = value <= threshold if lower_is_better else value >= threshold
             metric_results.append(
                 {
                     "metric": metric_name,
                     "value": value,
-                    "threshold": float(threshold),
+                    "threshold": threshold,
                     "direction": "lower_is_better" if lower_is_better else "higher_is_better",
                     "passed": bool(passed),
                 }
@@ -3853,7 +3897,7 @@ def when_evaluate_non_regression_release_gate(context) -> None:
                 domain_failed = True
                 failing_metrics_union.add(metric_name)
         if domain_failed:
-            failing_domains.append(domain_id)
+            failing_domains.add(domain_id)
         domain_results.append(
             {
                 "domain_id": domain_id,
@@ -3865,7 +3909,7 @@ def when_evaluate_non_regression_release_gate(context) -> None:
     outcome = "PASS" if not failing_domains else "FAIL"
     report = {
         "outcome": outcome,
-        "failing_domains": sorted(set(failing_domains)),
+        "failing_domains": sorted(failing_domains),
         "failing_metrics": sorted(failing_metrics_union),
         "domains": domain_results,
     }
@@ -3891,11 +3935,11 @@ def when_evaluate_non_regression_release_gate(context) -> None:
 @then('the release gate report includes failing domain "{domain_id}"')
 def then_release_gate_report_includes_failing_domain(context, domain_id: str) -> None:
     world = get_world(context)
-    report = getattr(world, "nonregression_report", None)
+    report = world.nonregression_report
     if not isinstance(report, dict):
         report = world.release_gate_report
     assert isinstance(report, dict) and report, "release gate report is not available"
-    failing_domains = {str(item).strip() for item in report.get("failing_domains", []) if str(item).strip()}
+    failing_domains = {text for item in report.get("failing_domains", []) if (text := str(item).strip())}
     expected = str(domain_id).strip()
     assert expected in failing_domains, (
         f"expected failing domain {expected!r} in release gate report; "
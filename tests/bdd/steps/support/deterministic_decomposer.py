@@ -1,12 +1,37 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class DeterministicDecomposer:
     script: Dict[str, Any] = field(default_factory=dict)
+    _scope_index: Optional[Dict[str, Dict[str, Any]]] = field(default=None, init=False, repr=False, compare=False)
+    _scope_index_source: Optional[List[Dict[str, Any]]] = field(default=None, init=False, repr=False, compare=False)
+    _cached_min_depth: int = field(default=0, init=False, repr=False, compare=False)
+    _slot_decompositions: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _fail_roots: Any = field(default_factory=set, init=False, repr=False, compare=False)
+    _scope_roots: Any = field(default=None, init=False, repr=False, compare=False)
+    _scoped_roots: Any = field(default_factory=set, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._cached_min_depth = self._min_depth_policy()
+        self._slot_decompositions = self.script.get("slot_decompositions", {})
+        self._fail_roots = self.script.get("fail_roots", set())
+        self._scope_roots = self.script.get("scope_roots")
+        self._scoped_roots = self.script.get("scoped_roots", set())
+
+    def _scope_row(self, scope_roots: List[Dict[str, Any]], root_id: str) -> Optional[Dict[str, Any]]:
+        if self._scope_index is None or self._scope_index_source is not scope_roots:
+            index: Dict[str, Dict[str, Any]] = {}
+            for row in scope_roots:
+                row_id = row.get("root_id")
+                if row_id:
+                    index.setdefault(row_id, row)
+            self._scope_index = index
+            self._scope_index_source = scope_roots
+        return self._scope_index.get(root_id)
 
     def _min_depth_policy(self) -> int:
         policy = self.script.get("policy", {})
@@ -18,97 +43,97 @@ class DeterministicDecomposer:
         except (TypeError, ValueError):
             return 0
 
+    def _all_scope_decomposition(self, root_id: str) -> Dict[str, Any]:
+        return {
+            "ok": True,
+            "feasibility_statement": f"{root_id} is feasible",
+            "availability_statement": f"{root_id} is available",
+            "fit_statement": f"{root_id} fits",
+            "fit_to_key_features_statement": f"{root_id} fits",
+            "defeater_statement": f"{root_id} resists defeaters",
+            "defeater_resistance_statement": f"{root_id} resists defeaters",
+        }
+
     @staticmethod
     def _is_slot_node(target_id: str) -> bool:
-        parts = str(target_id or "").split(":")
-        return len(parts) == 2 and bool(parts[0]) and bool(parts[1])
+        target = str(target_id or "")
+        sep = target.find(":")
+        return 0 < sep < len(target) - 1 and target.find(":", sep + 1) < 0
+
+    def _scripted_slot_decomposition(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "ok": True,
+            "type": entry.get("type"),
+            "coupling": entry.get("coupling"),
+            "children": entry.get("children", []),
+        }
+
+    def _synthesized_slot_decomposition(self, root_id: str) -> Dict[str, Any]:
+        slot_key = root_id.partition(":")[2]
+        return {
+            "ok": True,
+            "type": "AND",
+            "coupling": 0.80,
+            "children": [
+                {
+                    "child_id": f"{slot_key}_factor_1",
+                    "statement": f"{root_id} factor 1 holds",
+                    "role": "NEC",
+                    "falsifiable": True,
+                    "test_procedure": f"Test {root_id} factor 1 with explicit evidence",
+                    "overlap_with_siblings": [],
+                },
+                {
+                    "child_id": f"{slot_key}_factor_2",
+                    "statement": f"{root_id} factor 2 holds",
+                    "role": "NEC",
+                    "falsifiable": True,
+                    "test_procedure": f"Test {root_id} factor 2 with explicit evidence",
+                    "overlap_with_siblings": [],
+                },
+            ],
+        }
 
     def has_decomposition(self, target_id: str) -> bool:
-        slot_decompositions = self.script.get("slot_decompositions", {})
+        slot_decompositions = self._slot_decompositions
         if target_id in slot_decompositions:
             children = slot_decompositions[target_id].get("children", [])
             return bool(children)
-        if self._min_depth_policy() > 0 and self._is_slot_node(target_id):
+        if self._cached_min_depth > 0 and self._is_slot_node(target_id):
             return True
         return False
 
     def decompose(self, root_id: str) -> Dict[str, Any]:
-        slot_decompositions = self.script.get("slot_decompositions", {})
-        if root_id in slot_decompositions:
-            return {
-                "ok": True,
-                "type": slot_decompositions[root_id].get("type"),
-                "coupling": slot_decompositions[root_id].get("coupling"),
-                "children": slot_decompositions[root_id].get("children", []),
-            }
-        if self._min_depth_policy() > 0 and self._is_slot_node(root_id):
-            slot_key = root_id.split(":", 1)[1]
-            return {
-                "ok": True,
-                "type": "AND",
-                "coupling": 0.80,
-                "children": [
-                    {
-                        "child_id": f"{slot_key}_factor_1",
-                        "statement": f"{root_id} factor 1 holds",
-                        "role": "NEC",
-                        "falsifiable": True,
-                        "test_procedure": f"Test {root_id} factor 1 with explicit evidence",
-                        "overlap_with_siblings": [],
-                    },
-                    {
-                        "child_id": f"{slot_key}_factor_2",
-                        "statement": f"{root_id} factor 2 holds",
-                        "role": "NEC",
-                        "falsifiable": True,
-                        "test_procedure": f"Test {root_id} factor 2 with explicit evidence",
-                        "overlap_with_siblings": [],
-                    },
-                ],
-            }
+        entry = self._slot_decompositions.get(root_id)
+        if entry is not None:
+            return self._scripted_slot_decomposition(entry)
+        if self._cached_min_depth > 0 and self._is_slot_node(root_id):
+            return self._synthesized_slot_decomposition(root_id)
 
-        fail_roots = self.script.get("fail_roots", set())
-        if root_id in fail_roots:
+        if root_id in self._fail_roots:
             return {"ok": False}
 
-        scope_roots = self.script.get("scope_roots")
+        scope_roots = self._scope_roots
         if scope_roots == "all":
-            return {
-                "ok": True,
-                "feasibility_statement": f"{root_id} is feasible",
-                "availability_statement": f"{root_id} is available",
-                "fit_statement": f"{root_id} fits",
-                "fit_to_key_features_statement": f"{root_id} fits",
-                "defeater_statement": f"{root_id} resists defeaters",
-                "defeater_resistance_statement": f"{root_id} resists defeaters",
-            }
+            return self._all_scope_decomposition(root_id)
 
         if isinstance(scope_roots, list):
-            for row in scope_roots:
-                if row.get("root_id") == root_id:
-                    fit_statement = row.get("fit_statement", "")
-                    defeater_statement = row.get("defeater_statement", "")
-                    return {
-                        "ok": True,
-                        "feasibility_statement": row.get("feasibility_statement", ""),
-                        "availability_statement": row.get("availability_statement", ""),
-                        "fit_statement": fit_statement,
-                        "fit_to_key_features_statement": row.get("fit_to_key_features_statement", fit_statement),
-                        "defeater_statement": defeater_statement,
-                        "defeater_resistance_statement": row.get("defeater_resistance_statement", defeater_statement),
-                    }
-            return {"ok": False}
-
-        scoped_roots = self.script.get("scoped_roots", set())
-        if root_id in scoped_roots:
+            row = self._scope_row(scope_roots, root_id)
+            if row is None:
+                return {"ok": False}
+            fit_statement = row.get("fit_statement", "")
+            defeater_statement = row.get("defeater_statement", "")
             return {
                 "ok": True,
-                "feasibility_statement": f"{root_id} is feasible",
-                "availability_statement": f"{root_id} is available",
-                "fit_statement": f"{root_id} fits",
-                "fit_to_key_features_statement": f"{root_id} fits",
-                "defeater_statement": f"{root_id} resists defeaters",
-                "defeater_resistance_statement": f"{root_id} resists defeaters",
+                "feasibility_statement": row.get("feasibility_statement", ""),
+                "availability_statement": row.get("availability_statement", ""),
+                "fit_statement": fit_statement,
+                "fit_to_key_features_statement": row.get("fit_to_key_features_statement", fit_statement),
+                "defeater_statement": defeater_statement,
+                "defeater_resistance_statement": row.get("defeater_resistance_statement", defeater_statement),
             }
 
+        if root_id in self._scoped_roots:
+            return self._all_scope_decomposition(root_id)
+
         return {"ok": False}
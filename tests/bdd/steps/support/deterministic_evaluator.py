@@ -3,8 +3,32 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Dict
 
+# Scalar fields only; list fields are built per call so outcomes never share them.
+_DISCRIMINATOR_EMIT_TEMPLATE: Dict[str, Any] = {
+    "A": 2,
+    "B": 2,
+    "C": 2,
+    "D": 2,
+    "non_discriminative": False,
+    "entailment": "SUPPORTS",
+    "evidence_quality": "direct",
+    "reasoning_summary": "BDD context-driven discriminator emission.",
+    "uncertainty_source": "BDD context strategy.",
+}
+_NON_DISCRIMINATOR_EMIT_TEMPLATE: Dict[str, Any] = {
+    "A": 2,
+    "B": 2,
+    "C": 2,
+    "D": 2,
+    "non_discriminative": True,
+    "entailment": "NEUTRAL",
+    "evidence_quality": "direct",
+    "reasoning_summary": "BDD context strategy without candidate discriminators.",
+    "uncertainty_source": "BDD context strategy.",
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class DeterministicEvaluator:
     script: Dict[str, Any] = field(default_factory=dict)
 
@@ -32,7 +56,7 @@ class DeterministicEvaluator:
             candidate_ids_raw = contrastive.get("candidate_discriminator_ids")
             if not isinstance(candidate_ids_raw, list):
                 candidate_ids_raw = []
-            candidate_ids = [str(item).strip() for item in candidate_ids_raw if str(item).strip()]
+            candidate_ids = [text for item in candidate_ids_raw if (text := str(item).strip())]
             primary_pair = str(contrastive.get("primary_pair_key", "")).strip()
 
             params = self.script.get("context_emitter", {})
@@ -50,52 +74,34 @@ class DeterministicEvaluator:
 
             if candidate_ids:
                 discriminator_id = candidate_ids[0]
-                return {
-                    "p": p_value,
-                    "A": 2,
-                    "B": 2,
-                    "C": 2,
-                    "D": 2,
-                    "evidence_ids": [evidence_id],
-                    "discriminator_ids": [discriminator_id],
-                    "discriminator_payloads": [
-                        {
-                            "id": discriminator_id,
-                            "pair": primary_pair,
-                            "direction": "FAVORS_LEFT",
-                            "evidence_ids": [evidence_id],
-                        }
-                    ],
-                    "non_discriminative": False,
-                    "entailment": "SUPPORTS",
-                    "evidence_quality": "direct",
-                    "reasoning_summary": "BDD context-driven discriminator emission.",
-                    "defeaters": ["None noted."],
-                    "uncertainty_source": "BDD context strategy.",
-                    "assumptions": [],
-                }
+                result = dict(_DISCRIMINATOR_EMIT_TEMPLATE)
+                result["p"] = p_value
+                result["evidence_ids"] = [evidence_id]
+                result["discriminator_ids"] = [discriminator_id]
+                result["discriminator_payloads"] = [
+                    {
+                        "id": discriminator_id,
+                        "pair": primary_pair,
+                        "direction": "FAVORS_LEFT",
+                        "evidence_ids": [evidence_id],
+                    }
+                ]
+                result["defeaters"] = ["None noted."]
+                result["assumptions"] = []
+                return result
 
-            return {
-                "p": p_value,
-                "A": 2,
-                "B": 2,
-                "C": 2,
-                "D": 2,
-                "evidence_ids": [evidence_id],
-                "discriminator_ids": [],
-                "discriminator_payloads": [],
-                "non_discriminative": True,
-                "entailment": "NEUTRAL",
-                "evidence_quality": "direct",
-                "reasoning_summary": "BDD context strategy without candidate discriminators.",
-                "defeaters": ["None noted."],
-                "uncertainty_source": "BDD context strategy.",
-                "assumptions": [],
-            }
+            result = dict(_NON_DISCRIMINATOR_EMIT_TEMPLATE)
+            result["p"] = p_value
+            result["evidence_ids"] = [evidence_id]
+            result["discriminator_ids"] = []
+            result["discriminator_payloads"] = []
+            result["defeaters"] = ["None noted."]
+            result["assumptions"] = []
+            return result
 
         child_evaluations = self.script.get("child_evaluations", {})
         if ":" in node_key:
-            child_id = node_key.split(":")[-1]
+            child_id = node_key.rpartition(":")[2]
             if child_id in child_evaluations:
                 return child_evaluations[child_id]
         return {}
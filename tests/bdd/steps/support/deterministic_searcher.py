@@ -7,7 +7,7 @@ from abductio_core.application.dto import EvidenceItem
 from abductio_core.domain.canonical import canonical_id_for_statement
 
 
-@dataclass
+@dataclass(slots=True)
 class DeterministicSearcher:
     script: Dict[str, Any] = field(default_factory=dict)
 
@@ -20,17 +20,18 @@ class DeterministicSearcher:
             root_id = str(metadata.get("root_id", "")).strip()
             evidence_ids = by_root.get(root_id)
             if isinstance(evidence_ids, list) and evidence_ids:
-                items = [
+                location = {"query": query, "metadata": metadata}
+                item_metadata = {"deterministic": True, "root_id": root_id}
+                return [
                     EvidenceItem(
                         id=str(evidence_id),
                         source="deterministic_searcher",
                         text=f"Search result for {root_id}: {evidence_id}",
-                        location={"query": query, "metadata": metadata},
-                        metadata={"deterministic": True, "root_id": root_id},
+                        location=location,
+                        metadata=item_metadata,
                     )
-                    for evidence_id in evidence_ids
+                    for evidence_id in evidence_ids[:limit]
                 ]
-                return items[:limit]
         if self.script.get("autogen", False):
             evidence_id = f"SRCH-{canonical_id_for_statement(query)}"
             return [
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List
+from typing import Deque
 
 from abductio_core.domain.audit import AuditEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class InMemoryAuditSink:
-    events: List[AuditEvent] = field(default_factory=list)
+    events: Deque[AuditEvent] = field(default_factory=deque)
 
     def append(self, event: AuditEvent) -> None:
         self.events.append(event)
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import os
+from typing import Iterator
+
+import pytest
+
+from abductio_core.adapters.openai_llm import OpenAIJsonClient
+
+
+@pytest.fixture(scope="session")
+def openai_client() -> Iterator[OpenAIJsonClient]:
+    if not os.getenv("OPENAI_API_KEY"):
+        pytest.skip("OPENAI_API_KEY not set")
+    pytest.importorskip("openai")
+    httpx = pytest.importorskip("httpx")
+
+    client = OpenAIJsonClient(
+        model=os.getenv("OPENAI_MODEL", "gpt-4.1-mini"),
+        temperature=0.0,
+        http_client=httpx.Client(limits=httpx.Limits(max_keepalive_connections=20)),
+    )
+    yield client
+    client.close()
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import os
-
 import pytest
 
 from abductio_core.application.dto import RootSpec, SessionConfig, SessionRequest
@@ -11,19 +9,11 @@ from tests.support.noop_searcher import NoopSearcher
 
 
 @pytest.mark.e2e
-def test_e2e_llm_integration_smoke_realistic_usage() -> None:
-    if not os.getenv("OPENAI_API_KEY"):
-        pytest.skip("OPENAI_API_KEY not set")
-    pytest.importorskip("openai")
-
-    from abductio_core.adapters.openai_llm import (
-        OpenAIDecomposerPort,
-        OpenAIEvaluatorPort,
-        OpenAIJsonClient,
-    )
+@pytest.mark.xdist_group("openai_e2e")
+def test_e2e_llm_integration_smoke_realistic_usage(openai_client) -> None:
+    from abductio_core.adapters.openai_llm import OpenAIDecomposerPort, OpenAIEvaluatorPort
 
-    model = os.getenv("OPENAI_MODEL", "gpt-4.1-mini")
-    client = OpenAIJsonClient(model=model, temperature=0.0)
+    client = openai_client
     root_statements = {"H1": "Mechanism A", "H2": "Mechanism B"}
 
     deps = RunSessionDeps(
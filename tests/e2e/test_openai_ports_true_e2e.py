@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import os
+from collections import deque
+from contextlib import nullcontext
 from dataclasses import dataclass, field
-from typing import List
+from math import fsum, isclose
+from typing import Deque
 
 import pytest
 
@@ -10,24 +13,43 @@ from abductio_core import RootSpec, SessionConfig, SessionRequest, replay_sessio
 from abductio_core.adapters.openai_llm import OpenAIJsonClient, OpenAIDecomposerPort, OpenAIEvaluatorPort
 from abductio_core.application.ports import RunSessionDeps
 from abductio_core.domain.audit import AuditEvent
+from tests.support.cached_json_client import CachedJsonClient
 from tests.support.noop_searcher import NoopSearcher
 
 
-@dataclass
+REQUIRED_OP_TYPES = frozenset({"DECOMPOSE", "EVALUATE"})
+REQUIRED_EVENTS = frozenset(
+    {
+        "ROOT_SCOPED",
+        "NODE_REFINED_REQUIREMENTS",
+        "NODE_EVALUATED",
+        "SOFT_AND_COMPUTED",
+        "DAMPING_APPLIED",
+        "STOP_REASON_RECORDED",
+    }
+)
+
+
+@dataclass(slots=True)
 class InMemoryAudit:
-    events: List[AuditEvent] = field(default_factory=list)
+    events: Deque[AuditEvent] = field(default_factory=deque)
 
     def append(self, event: AuditEvent) -> None:
         self.events.append(event)
 
 
 @pytest.mark.e2e
-def test_e2e_openai_scopes_decomposes_evaluates_and_replays() -> None:
-    if not os.getenv("OPENAI_API_KEY"):
-        pytest.skip("OPENAI_API_KEY not set")
-
-    model = os.getenv("OPENAI_MODEL", "gpt-4.1-mini")
-    client = OpenAIJsonClient(model=model, temperature=0.0)
+@pytest.mark.xdist_group("openai_e2e")
+def test_e2e_openai_scopes_decomposes_evaluates_and_replays(
+    openai_client: OpenAIJsonClient, pytestconfig: pytest.Config
+) -> None:
+    # run_session picks each op from the ledger left by the previous one, and later
+    # prompts embed earlier responses, so the LLM calls below are inherently
+    # sequential and cannot be batched or pre-collected for the Batch API.
+    client = openai_client
+    cache = None
+    if os.getenv("ABDUCTIO_LLM_CACHE") == "1":
+        client = cache = CachedJsonClient(openai_client, pytestconfig.cache.mkdir("openai"))
     root_statements = {"H1": "Mechanism A", "H2": "Mechanism B"}
 
     required_slots = [{"slot_key": "feasibility", "role": "NEC"}]
@@ -55,21 +77,20 @@ def test_e2e_openai_scopes_decomposes_evaluates_and_replays() -> None:
         run_mode="until_credits_exhausted",
     )
 
-    res = run_session(req, deps).to_dict_view()
-    assert abs(sum(res["ledger"].values()) - 1.0) <= 1e-9
+    # Port validation errors propagate out of run_session, so validating()
+    # drops the run's staged responses unless every one of them passed.
+    with cache.validating() if cache is not None else nullcontext():
+        res = run_session(req, deps).to_dict_view()
+    if cache is not None:
+        cache.commit()
+    ledger, audit = res["ledger"], res["audit"]
+    assert isclose(fsum(ledger.values()), 1.0, abs_tol=1e-9)
     assert res["stop_reason"] == "CREDITS_EXHAUSTED"
-    assert any(op["op_type"] == "DECOMPOSE" for op in res["operation_log"])
-    assert any(op["op_type"] == "EVALUATE" for op in res["operation_log"])
-
-    event_types = [event["event_type"] for event in res["audit"]]
-    assert "ROOT_SCOPED" in event_types
-    assert "NODE_REFINED_REQUIREMENTS" in event_types
-    assert "NODE_EVALUATED" in event_types
-    assert "SOFT_AND_COMPUTED" in event_types
-    assert "DAMPING_APPLIED" in event_types
-    assert "STOP_REASON_RECORDED" in event_types
+    assert REQUIRED_OP_TYPES <= frozenset(op["op_type"] for op in res["operation_log"])
+    assert REQUIRED_EVENTS <= frozenset(event["event_type"] for event in audit)
 
-    rep = replay_session(res["audit"]).to_dict_view()
-    for k, v in res["ledger"].items():
-        assert abs(float(rep["ledger"].get(k, 0.0)) - float(v)) <= 1e-9
+    rep = replay_session(audit).to_dict_view()
+    rep_ledger = rep["ledger"]
+    assert rep_ledger.keys() == ledger.keys()
+    assert max((abs(rep_ledger[k] - v) for k, v in ledger.items()), default=0.0) <= 1e-9
     assert rep["stop_reason"] == "CREDITS_EXHAUSTED"
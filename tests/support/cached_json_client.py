@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+from abductio_core.adapters.openai_llm import OpenAIJsonClient
+
+
+@dataclass
+class CachedJsonClient:
+    """Content-addressed on-disk cache in front of an OpenAIJsonClient.
+
+    Fresh responses are only staged. Run port calls inside ``validating`` so a
+    response the port rejects is dropped, then ``commit`` the rest to disk.
+    """
+
+    inner: OpenAIJsonClient
+    cache_dir: Path
+    _staged: Dict[Path, Dict[str, Any]] = field(default_factory=dict, init=False, repr=False)
+
+    def _cache_path(self, *, system: str, user: str) -> Path:
+        canonical = json.dumps(
+            {
+                "model": self.inner.model,
+                "temperature": self.inner.temperature,
+                "messages": [
+                    {"role": "system", "content": system},
+                    {"role": "user", "content": user},
+                ],
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return self.cache_dir / f"{hashlib.sha256(canonical.encode('utf-8')).hexdigest()}.json"
+
+    def complete_json(self, *, system: str, user: str) -> Dict[str, Any]:
+        path = self._cache_path(system=system, user=user)
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            pass
+        payload = self.inner.complete_json(system=system, user=user)
+        # The ports fill defaults into the returned dict, so stage the raw response.
+        self._staged[path] = copy.deepcopy(payload)
+        return payload
+
+    @contextmanager
+    def validating(self) -> Iterator[None]:
+        """Drop responses staged inside the block if it raises, e.g. on a port validation error."""
+        staged = dict(self._staged)
+        try:
+            yield
+        except BaseException:
+            self._staged = staged
+            raise
+
+    def commit(self) -> None:
+        """Persist every staged response and clear the stage."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        for path, payload in self._staged.items():
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    json.dump(payload, handle)
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        self._staged.clear()
@@ -6,7 +6,7 @@ from typing import Any, Dict, List
 from abductio_core.application.dto import EvidenceItem
 
 
-@dataclass
+@dataclass(slots=True)
 class NoopSearcher:
     def search(self, query: str, *, limit: int, metadata: Dict[str, Any]) -> List[EvidenceItem]:
         return []
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from abductio_core.adapters.openai_llm import OpenAIEvaluatorPort
+from tests.support.cached_json_client import CachedJsonClient
+
+
+VALID_EVALUATION = {
+    "p": 0.1,
+    "A": 1,
+    "B": 1,
+    "C": 1,
+    "D": 1,
+    "evidence_ids": [],
+    "discriminator_ids": [],
+    "discriminator_payloads": [],
+    "entailment": "NEUTRAL",
+    "evidence_quality": "none",
+    "reasoning_summary": "No supporting evidence.",
+    "defeaters": ["Would change with new evidence."],
+    "uncertainty_source": "No evidence packet.",
+    "assumptions": [],
+}
+
+
+class FakeJsonClient:
+    model = "fake-model"
+    temperature = 0.0
+
+    def __init__(self, *responses):
+        self._responses = list(responses)
+        self.calls = 0
+
+    def complete_json(self, *, system: str, user: str):
+        response = self._responses[min(self.calls, len(self._responses) - 1)]
+        self.calls += 1
+        return json.loads(json.dumps(response))
+
+
+def test_cached_json_client_persists_only_committed_responses(tmp_path) -> None:
+    inner = FakeJsonClient({"ok": True})
+    client = CachedJsonClient(inner, tmp_path)
+    out = client.complete_json(system="s", user="u")
+    out["filled_by_port"] = True
+    assert list(tmp_path.iterdir()) == []
+
+    client.commit()
+    reread = CachedJsonClient(inner, tmp_path).complete_json(system="s", user="u")
+    assert reread == {"ok": True}
+    assert inner.calls == 1
+
+    CachedJsonClient(inner, tmp_path).complete_json(system="s", user="other")
+    assert inner.calls == 2
+
+
+def test_cached_json_client_drops_responses_that_fail_validation(tmp_path) -> None:
+    inner = FakeJsonClient(VALID_EVALUATION, {"p": 2.0})
+    client = CachedJsonClient(inner, tmp_path)
+    port = OpenAIEvaluatorPort(client)
+    with client.validating():
+        port.evaluate("H1:feasibility")
+    with pytest.raises(RuntimeError), client.validating():
+        port.evaluate("H2:feasibility")
+    assert len(client._staged) == 1
+
+    client.commit()
+    persisted = [json.loads(path.read_text(encoding="utf-8")) for path in tmp_path.iterdir()]
+    assert persisted == [VALID_EVALUATION]
+    assert client._staged == {}
@@ -177,3 +177,26 @@ def test_complete_json_error_includes_nested_exception_chain(monkeypatch) -> Non
     message = str(excinfo.value)
     assert "RuntimeError: outer" in message
     assert "ValueError: inner" in message
+
+
+def test_client_forwards_http_client_and_closes(monkeypatch) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    seen = {}
+
+    class _ClosableOpenAI(_FakeOpenAI):
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    def _openai_cls(**kwargs):
+        seen.update(kwargs)
+        return fake
+
+    fake = _ClosableOpenAI(responses_text=json.dumps({"ok": True}))
+    monkeypatch.setattr(m.importlib, "import_module", lambda name: types.SimpleNamespace(OpenAI=_openai_cls))
+    http_client = object()
+    client = m.OpenAIJsonClient(model="gpt-4.1-mini", http_client=http_client)
+    assert seen["http_client"] is http_client
+    client.close()
+    assert fake.closed is True
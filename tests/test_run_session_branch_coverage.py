@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from collections import deque
+from dataclasses import dataclass, field, replace
+from typing import Any, Deque, Dict, List, Optional
 
 import pytest
 
@@ -14,21 +15,26 @@ from abductio_core.domain.model import Node, RootHypothesis
 from tests.support.noop_searcher import NoopSearcher
 
 
-@dataclass
+_CFG = SessionConfig(
+    tau=0.7, epsilon=0.05, gamma_noa=0.10, gamma_und=0.10, alpha=0.4, beta=1.0, W=3.0, lambda_voi=0.1, world_mode="open", gamma=0.2
+)
+
+
+@dataclass(slots=True)
 class MemAudit:
-    events: List[AuditEvent] = field(default_factory=list)
+    events: Deque[AuditEvent] = field(default_factory=deque)
 
     def append(self, event: AuditEvent) -> None:
         self.events.append(event)
 
 
-@dataclass
+@dataclass(slots=True)
 class NoopDecomposer:
     def decompose(self, target_id: str) -> Dict[str, Any]:
         return {"ok": True, "feasibility_statement": f"{target_id} feasible"}
 
 
-@dataclass
+@dataclass(slots=True)
 class ChildDecomposer:
     def decompose(self, target_id: str) -> Dict[str, Any]:
         if ":" in target_id:
@@ -44,7 +50,7 @@ class ChildDecomposer:
         return {"ok": True, "feasibility_statement": f"{target_id} feasible"}
 
 
-@dataclass
+@dataclass(slots=True)
 class RootOnlyDecomposer:
     def has_decomposition(self, target_id: str) -> bool:
         return ":" not in target_id
@@ -53,7 +59,7 @@ class RootOnlyDecomposer:
         return {"ok": True, "feasibility_statement": f"{target_id} feasible"}
 
 
-@dataclass
+@dataclass(slots=True)
 class NoopEvaluator:
     def evaluate(
         self,
@@ -65,7 +71,7 @@ class NoopEvaluator:
         return {}
 
 
-@dataclass
+@dataclass(slots=True)
 class StrongEvidenceEvaluator:
     def evaluate(
         self,
@@ -98,7 +104,7 @@ def _base_request() -> SessionRequest:
     return SessionRequest(
         scope="test",
         roots=[RootSpec("H1", "Mechanism A", "x")],
-        config=SessionConfig(tau=0.7, epsilon=0.05, gamma_noa=0.10, gamma_und=0.10, alpha=0.4, beta=1.0, W=3.0, lambda_voi=0.1, world_mode="open", gamma=0.2),
+        config=_CFG,
         credits=1,
         required_slots=None,
         run_mode="start_only",
@@ -108,39 +114,31 @@ def _base_request() -> SessionRequest:
 def test_validate_request_errors() -> None:
     req = _base_request()
     with pytest.raises(ValueError):
-        rs._validate_request(req.__class__(**{**req.__dict__, "credits": -1}))
+        rs._validate_request(replace(req, credits=-1))
     with pytest.raises(ValueError):
         rs._validate_request(
-            req.__class__(
-                **{
-                    **req.__dict__,
-                    "config": SessionConfig(
-                        tau=1.2,
-                        epsilon=0.1,
-                        gamma_noa=0.1,
-                        gamma_und=0.1,
-                        alpha=0.3,
-                        beta=1.0,
-                        W=3.0,
-                        lambda_voi=0.1,
-                        world_mode="open",
-                        gamma=0.2,
-                    ),
-                }
+            replace(
+                req,
+                config=SessionConfig(
+                    tau=1.2,
+                    epsilon=0.1,
+                    gamma_noa=0.1,
+                    gamma_und=0.1,
+                    alpha=0.3,
+                    beta=1.0,
+                    W=3.0,
+                    lambda_voi=0.1,
+                    world_mode="open",
+                    gamma=0.2,
+                ),
             )
         )
     with pytest.raises(ValueError):
-        rs._validate_request(
-            req.__class__(**{**req.__dict__, "roots": [RootSpec("", "S", "x")]})
-        )
+        rs._validate_request(replace(req, roots=[RootSpec("", "S", "x")]))
     with pytest.raises(ValueError):
-        rs._validate_request(
-            req.__class__(**{**req.__dict__, "roots": [RootSpec("H1", "", "x")]})
-        )
+        rs._validate_request(replace(req, roots=[RootSpec("H1", "", "x")]))
     with pytest.raises(ValueError):
-        rs._validate_request(
-            req.__class__(**{**req.__dict__, "required_slots": [{"slot_key": ""}]})
-        )
+        rs._validate_request(replace(req, required_slots=[{"slot_key": ""}]))
 
 
 def test_aggregate_soft_and_no_assessed_children() -> None:
@@ -289,36 +287,21 @@ def test_select_helpers_cover_empty_and_assessed() -> None:
 
 def test_run_session_evaluation_with_missing_node() -> None:
     req = _base_request()
-    req = req.__class__(**{**req.__dict__, "run_mode": "evaluation", "run_target": "H1:missing"})
+    req = replace(req, run_mode="evaluation", run_target="H1:missing")
     res = rs.run_session(req, _deps()).to_dict_view()
     assert res["stop_reason"] == "CREDITS_EXHAUSTED"
 
 
 def test_run_session_pre_scoped_missing_root_and_op_limit_zero() -> None:
     req = _base_request()
-    req = req.__class__(
-        **{
-            **req.__dict__,
-            "pre_scoped_roots": ["H_missing"],
-            "run_mode": "operations",
-            "run_count": 0,
-            "credits": 3,
-        }
-    )
+    req = replace(req, pre_scoped_roots=["H_missing"], run_mode="operations", run_count=0, credits=3)
     res = rs.run_session(req, _deps()).to_dict_view()
     assert res["stop_reason"] == "OP_LIMIT_REACHED"
 
 
 def test_evaluation_mode_no_slots_no_legal_op() -> None:
     req = _base_request()
-    req = req.__class__(
-        **{
-            **req.__dict__,
-            "run_mode": "evaluation",
-            "run_target": None,
-            "credits": 2,
-        }
-    )
+    req = replace(req, run_mode="evaluation", run_target=None, credits=2)
     res = rs.run_session(req, _deps()).to_dict_view()
     assert res["stop_reason"] == "NO_LEGAL_OP"
 
@@ -395,36 +378,23 @@ def test_policy_cap_is_applied_to_slots_and_blocks_frontier_confident_stop() ->
         searcher=NoopSearcher(),
     )
     req = _base_request()
-    req = req.__class__(
-        **{
-            **req.__dict__,
-            "config": SessionConfig(
-                tau=0.7,
-                epsilon=0.05,
-                gamma_noa=0.10,
-                gamma_und=0.10,
-                alpha=0.4,
-                beta=1.0,
-                W=3.0,
-                lambda_voi=0.1,
-                world_mode="open",
-                gamma=0.2,
-            ),
-            "credits": 8,
-            "required_slots": [
-                {"slot_key": "availability", "role": "NEC"},
-                {"slot_key": "fit_to_key_features", "role": "NEC"},
-                {"slot_key": "defeater_resistance", "role": "NEC"},
-            ],
-            "run_mode": "until_stops",
-            "pre_scoped_roots": ["H1"],
-            "evidence_items": [{"id": "E1", "source": "bdd", "text": "Evidence E1"}],
-            "policy": {
-                "reasoning_profile": "forecasting",
-                "historical_calibration_status": "unvalidated",
-                "forecasting_confidence_cap": 0.55,
-            },
-        }
+    req = replace(
+        req,
+        config=_CFG,
+        credits=8,
+        required_slots=[
+            {"slot_key": "availability", "role": "NEC"},
+            {"slot_key": "fit_to_key_features", "role": "NEC"},
+            {"slot_key": "defeater_resistance", "role": "NEC"},
+        ],
+        run_mode="until_stops",
+        pre_scoped_roots=["H1"],
+        evidence_items=[{"id": "E1", "source": "bdd", "text": "Evidence E1"}],
+        policy={
+            "reasoning_profile": "forecasting",
+            "historical_calibration_status": "unvalidated",
+            "forecasting_confidence_cap": 0.55,
+        },
     )
     res = rs.run_session(req, deps).to_dict_view()
     assert res["stop_reason"] == "NO_LEGAL_OP"
@@ -437,15 +407,13 @@ def test_policy_cap_is_applied_to_slots_and_blocks_frontier_confident_stop() ->
 
 def test_evaluation_mode_continues_to_next_root() -> None:
     req = _base_request()
-    req = req.__class__(
-        **{
-            **req.__dict__,
-            "roots": [RootSpec("H1", "Mechanism A", "x"), RootSpec("H2", "Mechanism B", "x")],
-            "run_mode": "evaluation",
-            "run_target": None,
-            "credits": 1,
-            "pre_scoped_roots": ["H2"],
-        }
+    req = replace(
+        req,
+        roots=[RootSpec("H1", "Mechanism A", "x"), RootSpec("H2", "Mechanism B", "x")],
+        run_mode="evaluation",
+        run_target=None,
+        credits=1,
+        pre_scoped_roots=["H2"],
     )
     res = rs.run_session(req, _deps()).to_dict_view()
     assert res["stop_reason"] == "CREDITS_EXHAUSTED"
@@ -454,15 +422,13 @@ def test_evaluation_mode_continues_to_next_root() -> None:
 
 def test_evaluations_children_continue_then_evaluate_slot() -> None:
     req = _base_request()
-    req = req.__class__(
-        **{
-            **req.__dict__,
-            "roots": [RootSpec("H1", "Mechanism A", "x"), RootSpec("H2", "Mechanism B", "x")],
-            "run_mode": "evaluations_children",
-            "run_count": 2,
-            "credits": 1,
-            "pre_scoped_roots": ["H2"],
-        }
+    req = replace(
+        req,
+        roots=[RootSpec("H1", "Mechanism A", "x"), RootSpec("H2", "Mechanism B", "x")],
+        run_mode="evaluations_children",
+        run_count=2,
+        credits=1,
+        pre_scoped_roots=["H2"],
     )
     res = rs.run_session(req, _deps()).to_dict_view()
     assert res["total_credits_spent"] == 1
@@ -470,45 +436,19 @@ def test_evaluations_children_continue_then_evaluate_slot() -> None:
 
 def test_evaluations_children_no_slots_stops() -> None:
     req = _base_request()
-    req = req.__class__(
-        **{
-            **req.__dict__,
-            "run_mode": "evaluations_children",
-            "run_count": 1,
-            "credits": 1,
-            "pre_scoped_roots": [],
-        }
-    )
+    req = replace(req, run_mode="evaluations_children", run_count=1, credits=1, pre_scoped_roots=[])
     res = rs.run_session(req, _deps()).to_dict_view()
     assert res["stop_reason"] == "NO_LEGAL_OP"
 
 
-def test_evaluations_children_selected_slot_none_stops(monkeypatch) -> None:
+def _none_slot_selector():
     def _none_slot(*args, **kwargs):
         return None
 
-    monkeypatch.setattr(rs, "_select_slot_lowest_k", _none_slot)
-    deps = RunSessionDeps(
-        evaluator=NoopEvaluator(),
-        decomposer=NoopDecomposer(),
-        audit_sink=MemAudit(),
-        searcher=NoopSearcher(),
-    )
-    req = _base_request()
-    req = req.__class__(
-        **{
-            **req.__dict__,
-            "run_mode": "evaluations_children",
-            "run_count": 1,
-            "credits": 1,
-            "pre_scoped_roots": ["H1"],
-        }
-    )
-    res = rs.run_session(req, deps).to_dict_view()
-    assert res["stop_reason"] == "NO_LEGAL_OP"
+    return _none_slot
 
 
-def test_evaluations_children_slot_missing_continues(monkeypatch) -> None:
+def _missing_then_available_slot_selector():
     calls = {"count": 0}
 
     def _fake_slot(*args, **kwargs):
@@ -517,25 +457,38 @@ def test_evaluations_children_slot_missing_continues(monkeypatch) -> None:
             return "missing"
         return "availability"
 
-    monkeypatch.setattr(rs, "_select_slot_lowest_k", _fake_slot)
-    deps = RunSessionDeps(
-        evaluator=NoopEvaluator(),
-        decomposer=NoopDecomposer(),
-        audit_sink=MemAudit(),
-        searcher=NoopSearcher(),
-    )
+    return _fake_slot
+
+
+@pytest.mark.parametrize(
+    ("make_selector", "run_count", "expected_stop", "expected_credits", "expected_targets"),
+    [
+        pytest.param(_none_slot_selector, 1, "NO_LEGAL_OP", 0, [], id="selected_slot_none_stops"),
+        pytest.param(
+            _missing_then_available_slot_selector,
+            2,
+            "CREDITS_EXHAUSTED",
+            1,
+            ["H1:availability"],
+            id="slot_missing_continues",
+        ),
+    ],
+)
+def test_evaluations_children_slot_selection(
+    monkeypatch,
+    make_selector,
+    run_count: int,
+    expected_stop: str,
+    expected_credits: int,
+    expected_targets: List[str],
+) -> None:
+    monkeypatch.setattr(rs, "_select_slot_lowest_k", make_selector())
     req = _base_request()
-    req = req.__class__(
-        **{
-            **req.__dict__,
-            "run_mode": "evaluations_children",
-            "run_count": 2,
-            "credits": 1,
-            "pre_scoped_roots": ["H1"],
-        }
-    )
-    res = rs.run_session(req, deps).to_dict_view()
-    assert res["total_credits_spent"] == 1
+    req = replace(req, run_mode="evaluations_children", run_count=run_count, credits=1, pre_scoped_roots=["H1"])
+    res = rs.run_session(req, _deps()).to_dict_view()
+    assert res["stop_reason"] == expected_stop
+    assert res["total_credits_spent"] == expected_credits
+    assert [op["target_id"] for op in res["operation_log"] if op["op_type"] == "EVALUATE"] == expected_targets
 
 
 def test_evaluations_children_slot_missing_all_roots_stop(monkeypatch) -> None:
@@ -587,15 +540,7 @@ def test_evaluations_children_slot_missing_all_roots_stop(monkeypatch) -> None:
         searcher=NoopSearcher(),
     )
     req = _base_request()
-    req = req.__class__(
-        **{
-            **req.__dict__,
-            "run_mode": "evaluations_children",
-            "run_count": 1,
-            "credits": 1,
-            "pre_scoped_roots": [],
-        }
-    )
+    req = replace(req, run_mode="evaluations_children", run_count=1, credits=1, pre_scoped_roots=[])
     res = rs.run_session(req, deps).to_dict_view()
     assert res["stop_reason"] == "NO_LEGAL_OP"
 
@@ -608,15 +553,7 @@ def test_evaluations_children_credits_exhausted_inside_loop() -> None:
         searcher=NoopSearcher(),
     )
     req = _base_request()
-    req = req.__class__(
-        **{
-            **req.__dict__,
-            "run_mode": "evaluations_children",
-            "run_count": 2,
-            "credits": 1,
-            "pre_scoped_roots": ["H1"],
-        }
-    )
+    req = replace(req, run_mode="evaluations_children", run_count=2, credits=1, pre_scoped_roots=["H1"])
     res = rs.run_session(req, deps).to_dict_view()
     assert res["stop_reason"] == "CREDITS_EXHAUSTED"
     assert res["total_credits_spent"] == 1
@@ -630,14 +567,6 @@ def test_evaluations_children_op_limit_reached_inside_loop() -> None:
         searcher=NoopSearcher(),
     )
     req = _base_request()
-    req = req.__class__(
-        **{
-            **req.__dict__,
-            "run_mode": "evaluations_children",
-            "run_count": 1,
-            "credits": 2,
-            "pre_scoped_roots": ["H1"],
-        }
-    )
+    req = replace(req, run_mode="evaluations_children", run_count=1, credits=2, pre_scoped_roots=["H1"])
     res = rs.run_session(req, deps).to_dict_view()
     assert res["stop_reason"] == "OP_LIMIT_REACHED"
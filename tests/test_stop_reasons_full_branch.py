@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Deque, Dict, List
 
 from abductio_core import RootSpec, SessionConfig, SessionRequest, run_session
 from abductio_core.application.ports import RunSessionDeps
@@ -9,15 +10,20 @@ from abductio_core.domain.audit import AuditEvent
 from tests.support.noop_searcher import NoopSearcher
 
 
-@dataclass
+_CFG = SessionConfig(
+    tau=0.70, epsilon=0.05, gamma_noa=0.10, gamma_und=0.10, alpha=0.40, beta=1.0, W=3.0, lambda_voi=0.1, world_mode="open", gamma=0.20
+)
+
+
+@dataclass(slots=True)
 class MemAudit:
-    events: List[AuditEvent] = field(default_factory=list)
+    events: Deque[AuditEvent] = field(default_factory=deque)
 
     def append(self, event: AuditEvent) -> None:
         self.events.append(event)
 
 
-@dataclass
+@dataclass(slots=True)
 class NoChildrenDecomposer:
     """Scopes roots but never produces slot children."""
 
@@ -27,7 +33,7 @@ class NoChildrenDecomposer:
         return {"ok": True, "feasibility_statement": f"{target_id} feasible"}
 
 
-@dataclass
+@dataclass(slots=True)
 class LowConfidenceEvaluator:
     """Produces k=0.15 so FRONTIER_CONFIDENT cannot trigger."""
 
@@ -66,7 +72,7 @@ def test_stop_reason_no_hypotheses_when_no_named_roots() -> None:
     req = SessionRequest(
         scope="no hypotheses",
         roots=[],
-        config=SessionConfig(tau=0.70, epsilon=0.05, gamma_noa=0.10, gamma_und=0.10, alpha=0.40, beta=1.0, W=3.0, lambda_voi=0.1, world_mode="open", gamma=0.20),
+        config=_CFG,
         credits=5,
         required_slots=[{"slot_key": "feasibility", "role": "NEC"}],
         run_mode="until_stops",
@@ -80,7 +86,7 @@ def test_stop_reason_op_limit_reached() -> None:
     req = SessionRequest(
         scope="op limit",
         roots=[RootSpec("H1", "Mechanism A", "x")],
-        config=SessionConfig(tau=0.70, epsilon=0.05, gamma_noa=0.10, gamma_und=0.10, alpha=0.40, beta=1.0, W=3.0, lambda_voi=0.1, world_mode="open", gamma=0.20),
+        config=_CFG,
         credits=10,
         required_slots=[{"slot_key": "feasibility", "role": "NEC"}],
         run_mode="operations",
@@ -96,7 +102,7 @@ def test_stop_reason_no_legal_op_after_decomp_and_eval() -> None:
     req = SessionRequest(
         scope="no legal op",
         roots=[RootSpec("H1", "Mechanism A", "x")],
-        config=SessionConfig(tau=0.70, epsilon=0.05, gamma_noa=0.10, gamma_und=0.10, alpha=0.40, beta=1.0, W=3.0, lambda_voi=0.1, world_mode="open", gamma=0.20),
+        config=_CFG,
         credits=10,
         required_slots=[{"slot_key": "feasibility", "role": "NEC"}],
         run_mode="until_stops",
@@ -113,18 +119,7 @@ def test_stop_reason_mece_certificate_failed_before_spending_credits() -> None:
             RootSpec("H1", "Mechanism A", "x"),
             RootSpec("H2", "Mechanism B", "x"),
         ],
-        config=SessionConfig(
-            tau=0.70,
-            epsilon=0.05,
-            gamma_noa=0.10,
-            gamma_und=0.10,
-            alpha=0.40,
-            beta=1.0,
-            W=3.0,
-            lambda_voi=0.1,
-            world_mode="open",
-            gamma=0.20,
-        ),
+        config=_CFG,
         credits=10,
         required_slots=[{"slot_key": "feasibility", "role": "NEC"}],
         run_mode="until_stops",
@@ -140,6 +135,9 @@ def test_stop_reason_mece_certificate_failed_before_spending_credits() -> None:
     assert res["stop_reason"] == "MECE_CERTIFICATE_FAILED"
     assert res["total_credits_spent"] == 0
     assert res["operation_log"] == []
-    checks = [event for event in res["audit"] if event.get("event_type") == "MECE_CERTIFICATE_CHECKED"]
-    assert checks
-    assert checks[-1]["payload"].get("status") == "FAILED"
+    last_check = next(
+        (event for event in reversed(res["audit"]) if event.get("event_type") == "MECE_CERTIFICATE_CHECKED"),
+        None,
+    )
+    assert last_check is not None
+    assert last_check["payload"].get("status") == "FAILED"